@@ -8,30 +8,52 @@ import os
 import re
 import json
 import shutil
+import hashlib
+import tempfile
 import argparse
 import logging
+import tomllib
+import importlib.metadata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dateutil import parser as dateparser
 from send2trash import send2trash  # Import the send2trash library
 
+
+def get_version():
+    # pyproject.toml is the single source of the version, installed or run from a checkout
+    try:
+        return importlib.metadata.version("renamr")
+    except importlib.metadata.PackageNotFoundError:
+        pyproject_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pyproject.toml")
+        try:
+            with open(pyproject_path, "rb") as f:
+                return tomllib.load(f)["tool"]["poetry"]["version"]
+        except (OSError, KeyError, tomllib.TOMLDecodeError):
+            return "unknown"
+
 class FileManager:
     def __init__(self, folder_path):
         self.folder_path = folder_path
         self.file_list = []
+        self.file_index = {}  # file path -> liststore row index
         self.show_directories = False
         self.show_hidden_files = False
         self.file_type_filter = None
 
     def load_files(self, liststore):
         self.file_list = []
+        self.file_index = {}
         liststore.clear()
         for entry in os.scandir(self.folder_path):
             if entry.is_file() or (self.show_directories and entry.is_dir()):
                 if not entry.name.startswith('.') or self.show_hidden_files:
                     file_type = self.get_file_type(entry)
                     if self.file_type_filter is None or file_type == self.file_type_filter:
+                        self.file_index[entry.path] = len(self.file_list)
                         self.file_list.append(entry.path)
                         icon = self.get_file_icon(entry.path)
-                        liststore.append([False, icon, entry.name, "", file_type, Gdk.RGBA()])
+                        liststore.append([False, icon, entry.name, "", file_type, Gdk.RGBA(), None])
 
     def get_file_icon(self, file_path):
         file_info = Gio.File.new_for_path(file_path).query_info('standard::icon', Gio.FileQueryInfoFlags.NONE, None)
@@ -68,7 +90,212 @@ class FileManager:
         self.file_type_filter = file_type
 
 
+class FileClipboard:
+    # Clipboard targets offered to other applications, text/uri-list is the
+    # standard one and x-special/gnome-copied-files carries the cut/copy intent
+    URI_LIST_TARGET = "text/uri-list"
+    GNOME_COPIED_FILES_TARGET = "x-special/gnome-copied-files"
+    TARGET_TEXT, TARGET_URI_LIST, TARGET_GNOME_COPIED_FILES = range(3)
+
+    def __init__(self):
+        self.operation = None  # "copy", "cut" or None
+        self.files = frozenset()
+        self.uris = None
+
+    def set(self, operation, files):
+        # Returns the paths whose cut state changed so callers restyle only those rows
+        old_cut = self.files if self.operation == "cut" else frozenset()
+        self.operation = operation
+        self.files = frozenset(files)
+        self.uris = None
+        new_cut = self.files if operation == "cut" else frozenset()
+        return old_cut ^ new_cut
+
+    def clear(self):
+        return self.set(None, ())
+
+    def is_cut(self, file_path):
+        return self.operation == "cut" and file_path in self.files
+
+    def get_uris(self):
+        if self.uris is None:
+            self.uris = [Gio.File.new_for_path(file_path).get_uri() for file_path in sorted(self.files)]
+        return self.uris
+
+    def get_gnome_copied_files(self):
+        return "\n".join([self.operation] + self.get_uris()).encode("utf-8")
+
+    @staticmethod
+    def parse_gnome_copied_files(data):
+        lines = data.decode("utf-8", "replace").splitlines()
+        if not lines or lines[0] not in ("copy", "cut"):
+            return None, []
+        return lines[0], FileClipboard.paths_from_uris(lines[1:])
+
+    @staticmethod
+    def paths_from_uris(uris):
+        paths = []
+        for uri in uris:
+            file_path = Gio.File.new_for_uri(uri).get_path() if uri else None
+            if file_path:
+                paths.append(file_path)
+        return paths
+
+
+class ThumbnailCache:
+    # Thumbnails are shared with other desktop tools through the freedesktop.org
+    # thumbnail spec layout: $XDG_CACHE_HOME/thumbnails/<flavor>/<md5(uri)>.png
+    SIZES = {"normal": 128, "large": 256}
+    UNAVAILABLE_LIMIT = 4096  # Upper bound on remembered files without a thumbnail
+
+    def __init__(self, flavor="normal", display_size=64, max_workers=None):
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        self.root = os.path.join(cache_home, "thumbnails")
+        self.flavor = flavor
+        self.size = self.SIZES[flavor]
+        self.display_size = display_size
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or min(4, os.cpu_count() or 1),
+                                           thread_name_prefix="renamr-thumbnail")
+        self.pending = {}  # file path -> [future, row reference]
+        self.unavailable = OrderedDict()  # file path -> mtime of files that produced no thumbnail
+        self.skipped = set()  # Paths in the current listing known to have no thumbnail
+        # Failure markers are per application and version
+        self.fail_flavor = os.path.join("fail", f"renamr-{get_version()}")
+
+    def thumbnail_path(self, uri, flavor=None):
+        name = hashlib.md5(uri.encode("utf-8"), usedforsecurity=False).hexdigest() + ".png"
+        return os.path.join(self.root, flavor or self.flavor, name)
+
+    def request(self, file_path, row_reference, callback):
+        # Called from the main loop; decoding always happens on the worker pool
+        if file_path in self.pending:
+            self.pending[file_path][1] = row_reference
+            return
+        future = self.executor.submit(self.load, file_path)
+        self.pending[file_path] = [future, row_reference]
+        future.add_done_callback(lambda f: GLib.idle_add(self.deliver, file_path, f, callback))
+
+    def deliver(self, file_path, future, callback):
+        entry = self.pending.get(file_path)
+        if entry is None or entry[0] is not future:
+            return False
+        del self.pending[file_path]
+        if future.cancelled():
+            return False
+        try:
+            mtime, pixbuf = future.result()
+        except Exception as e:
+            logging.debug(f"Thumbnail failed for {file_path}: {e}")
+            return False
+        if pixbuf is not None:
+            callback(entry[1], pixbuf)
+        else:
+            self.mark_unavailable(file_path, mtime)
+        return False
+
+    def mark_unavailable(self, file_path, mtime):
+        self.unavailable[file_path] = mtime
+        self.unavailable.move_to_end(file_path)
+        if len(self.unavailable) > self.UNAVAILABLE_LIMIT:
+            self.unavailable.popitem(last=False)
+        self.skipped.add(file_path)
+
+    def is_skipped(self, file_path):
+        return file_path in self.skipped
+
+    def revalidate(self):
+        # After a reload files may have changed, let the workers recheck their mtime
+        self.skipped.clear()
+
+    def retain(self, file_paths):
+        # Drop queued work for rows that scrolled out of view or were reloaded
+        for file_path in list(self.pending):
+            if file_path not in file_paths and self.pending[file_path][0].cancel():
+                del self.pending[file_path]
+
+    def shutdown(self):
+        self.pending.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def load(self, file_path):
+        # Runs on the worker pool, returns (mtime, pixbuf or None)
+        mtime = str(int(os.stat(file_path).st_mtime))
+        if self.unavailable.get(file_path) == mtime:
+            return mtime, None
+        if not os.path.isfile(file_path) or file_path.startswith(self.root + os.sep):
+            return mtime, None
+        content_type, _ = Gio.content_type_guess(file_path, None)
+        if not content_type or not content_type.startswith(("image/", "video/")):
+            return mtime, None  # Not a thumbnail candidate, leave the cache alone
+        uri = Gio.File.new_for_path(file_path).get_uri()
+        thumb_path = self.thumbnail_path(uri)
+        pixbuf = self.read_cached(thumb_path, uri, mtime)
+        if pixbuf is None:
+            file_format, width, height = GdkPixbuf.Pixbuf.get_file_info(file_path)
+            if file_format is None:
+                return mtime, None  # Only other thumbnailers can handle it, e.g. video
+            fail_path = self.thumbnail_path(uri, self.fail_flavor)
+            if self.read_cached(fail_path, uri, mtime) is not None:
+                return mtime, None
+            pixbuf = self.generate(file_path, thumb_path, uri, mtime, width, height)
+            if pixbuf is None:
+                marker = GdkPixbuf.Pixbuf.new(GdkPixbuf.Colorspace.RGB, True, 8, 1, 1)
+                marker.fill(0)
+                self.save(marker, fail_path, uri, mtime)
+                return mtime, None
+        return mtime, self.scale_to_fit(pixbuf, self.display_size)
+
+    def read_cached(self, thumb_path, uri, mtime):
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file(thumb_path)
+        except GLib.Error:
+            return None
+        if pixbuf.get_option("tEXt::Thumb::URI") != uri or pixbuf.get_option("tEXt::Thumb::MTime") != mtime:
+            return None  # Stale entry, the file changed since it was thumbnailed
+        return pixbuf
+
+    def generate(self, file_path, thumb_path, uri, mtime, width, height):
+        try:
+            if width > self.size or height > self.size:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(file_path, self.size, self.size, True)
+            else:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file(file_path)
+        except GLib.Error:
+            return None
+        pixbuf = pixbuf.apply_embedded_orientation()
+        self.save(pixbuf, thumb_path, uri, mtime)
+        return pixbuf
+
+    def save(self, pixbuf, thumb_path, uri, mtime):
+        try:
+            thumb_dir = os.path.dirname(thumb_path)
+            os.makedirs(thumb_dir, mode=0o700, exist_ok=True)
+            # Write to a temporary file first so other readers never see a partial PNG
+            fd, tmp_path = tempfile.mkstemp(suffix=".png", dir=thumb_dir)
+            os.close(fd)
+            try:
+                pixbuf.savev(tmp_path, "png",
+                             ["tEXt::Thumb::URI", "tEXt::Thumb::MTime", "tEXt::Software"],
+                             [uri, mtime, "Renamr"])
+                os.replace(tmp_path, thumb_path)
+            except (GLib.Error, OSError):
+                os.remove(tmp_path)
+                raise
+        except (GLib.Error, OSError) as e:
+            logging.debug(f"Could not write thumbnail {thumb_path}: {e}")
+
+    def scale_to_fit(self, pixbuf, size):
+        width, height = pixbuf.get_width(), pixbuf.get_height()
+        scale = min(size / width, size / height, 1)
+        if scale == 1:
+            return pixbuf
+        return pixbuf.scale_simple(max(1, int(width * scale)), max(1, int(height * scale)),
+                                   GdkPixbuf.InterpType.BILINEAR)
+
+
 class Renamr(Gtk.Window):
+    THUMBNAIL_ROW_LIMIT = 256  # Upper bound on rows holding a decoded thumbnail
+
     def __init__(self, folder_path=None, config_path=None, verbose_level=logging.INFO):
         super().__init__(title="Renamr")
         self.set_border_width(10)
@@ -91,13 +318,19 @@ class Renamr(Gtk.Window):
         # Initialize file manager
         self.file_manager = FileManager(folder_path if folder_path else os.path.expanduser("~"))
 
-        # Initialize cut files and copied files
-        self.copied_files = []
-        self.cut_files = []
+        # Initialize clipboard state, the window owns the clipboard selection
+        self.clipboard = FileClipboard()
+        self.setup_clipboard_targets()
 
         # Initialize undo stack
         self.undo_stack = []
 
+        # Initialize thumbnail cache, the thumbnail column is hidden by default
+        self.thumbnail_cache = ThumbnailCache()
+        self.show_thumbnails = False
+        self.thumbnail_update_source = None
+        self.thumbnail_rows = OrderedDict()  # row index -> row reference, least recently visible first
+
         # Layout container
         main_vbox = Gtk.VBox(spacing=6)
         self.add(main_vbox)
@@ -131,11 +364,16 @@ class Renamr(Gtk.Window):
         scrolled_window.add(self.treeview)
         right_vbox.pack_start(scrolled_window, True, True, 0)
 
+        # Only rows scrolled into view get thumbnails
+        vadjustment = scrolled_window.get_vadjustment()
+        vadjustment.connect("value-changed", self.on_treeview_scrolled)
+        vadjustment.connect("changed", self.on_treeview_scrolled)
+
         main_paned.pack2(right_vbox, resize=True, shrink=False)
 
         # Load files from the specified directory by default
         self.folder_path_entry.set_text(self.file_manager.folder_path)
-        self.file_manager.load_files(self.liststore)
+        self.reload_files()
 
         # Load configuration if provided
         if config_path:
@@ -144,6 +382,8 @@ class Renamr(Gtk.Window):
         # Connect the key press event to the TreeView
         self.treeview.connect("key-press-event", self.on_treeview_key_press)
 
+        self.connect("destroy", self.on_destroy)
+
     def create_menu_bar(self):
         self.menubar = Gtk.MenuBar()
 
@@ -209,6 +449,11 @@ class Renamr(Gtk.Window):
         show_hidden_files_item.connect("toggled", self.on_show_hidden_files_toggled)
         view_menu.append(show_hidden_files_item)
 
+        show_thumbnails_item = Gtk.CheckMenuItem(label="Show Thumbnails")
+        show_thumbnails_item.set_active(self.show_thumbnails)
+        show_thumbnails_item.connect("toggled", self.on_show_thumbnails_toggled)
+        view_menu.append(show_thumbnails_item)
+
         filter_by_type_item = Gtk.MenuItem(label="Filter by Type")
         filter_by_type_item.connect("activate", self.on_filter_by_type_clicked)
         view_menu.append(filter_by_type_item)
@@ -222,6 +467,7 @@ class Renamr(Gtk.Window):
         self.add_accel_group(accel_group)
         show_directories_item.add_accelerator("activate", accel_group, Gdk.KEY_d, Gdk.ModifierType.CONTROL_MASK, Gtk.AccelFlags.VISIBLE)
         show_hidden_files_item.add_accelerator("activate", accel_group, Gdk.KEY_h, Gdk.ModifierType.CONTROL_MASK, Gtk.AccelFlags.VISIBLE)
+        show_thumbnails_item.add_accelerator("activate", accel_group, Gdk.KEY_t, Gdk.ModifierType.CONTROL_MASK, Gtk.AccelFlags.VISIBLE)
         copy_item.add_accelerator("activate", accel_group, Gdk.KEY_c, Gdk.ModifierType.CONTROL_MASK, Gtk.AccelFlags.VISIBLE)
         cut_item.add_accelerator("activate", accel_group, Gdk.KEY_x, Gdk.ModifierType.CONTROL_MASK, Gtk.AccelFlags.VISIBLE)
         paste_item.add_accelerator("activate", accel_group, Gdk.KEY_v, Gdk.ModifierType.CONTROL_MASK, Gtk.AccelFlags.VISIBLE)
@@ -287,7 +533,7 @@ class Renamr(Gtk.Window):
         return entry
 
     def create_tree_view(self):
-        self.liststore = Gtk.ListStore(bool, GdkPixbuf.Pixbuf, str, str, str, Gdk.RGBA)
+        self.liststore = Gtk.ListStore(bool, GdkPixbuf.Pixbuf, str, str, str, Gdk.RGBA, GdkPixbuf.Pixbuf)
 
         treeview = self.treeview
         treeview.set_model(self.liststore)
@@ -300,6 +546,11 @@ class Renamr(Gtk.Window):
         column_toggle.set_resizable(True)
         treeview.append_column(column_toggle)
 
+        renderer_thumbnail = Gtk.CellRendererPixbuf()
+        self.column_thumbnail = Gtk.TreeViewColumn("Thumbnail", renderer_thumbnail, pixbuf=6)
+        self.column_thumbnail.set_visible(self.show_thumbnails)
+        treeview.append_column(self.column_thumbnail)
+
         renderer_pixbuf = Gtk.CellRendererPixbuf()
         renderer_text = Gtk.CellRendererText()
         renderer_text.set_property("editable", True)
@@ -402,7 +653,7 @@ class Renamr(Gtk.Window):
         if os.path.isdir(item_path):
             self.file_manager.navigate_to(item_path)
             self.folder_path_entry.set_text(self.file_manager.folder_path)
-            self.file_manager.load_files(self.liststore)
+            self.reload_files()
 
     def on_folder_clicked(self, widget):
         dialog = Gtk.FileChooserDialog(
@@ -417,7 +668,7 @@ class Renamr(Gtk.Window):
         if response == Gtk.ResponseType.OK:
             self.file_manager.navigate_to(dialog.get_filename())
             self.folder_path_entry.set_text(self.file_manager.folder_path)
-            self.file_manager.load_files(self.liststore)
+            self.reload_files()
             logging.info("Folder selected: " + self.file_manager.folder_path)
 
         dialog.destroy()
@@ -426,7 +677,7 @@ class Renamr(Gtk.Window):
         new_path = self.folder_path_entry.get_text()
         if self.file_manager.update_path(new_path):
             self.folder_path_entry.set_text(self.file_manager.folder_path)
-            self.file_manager.load_files(self.liststore)
+            self.reload_files()
             logging.info("Folder path changed to: " + self.file_manager.folder_path)
         else:
             logging.warning("Invalid folder path")
@@ -434,18 +685,83 @@ class Renamr(Gtk.Window):
     def on_up_clicked(self, widget):
         self.file_manager.navigate_up()
         self.folder_path_entry.set_text(self.file_manager.folder_path)
-        self.file_manager.load_files(self.liststore)
+        self.reload_files()
 
     def on_refresh_clicked(self, widget):
-        self.file_manager.load_files(self.liststore)
+        self.reload_files()
 
     def on_show_directories_toggled(self, widget):
         self.file_manager.show_directories = widget.get_active()
-        self.file_manager.load_files(self.liststore)
+        self.reload_files()
 
     def on_show_hidden_files_toggled(self, widget):
         self.file_manager.show_hidden_files = widget.get_active()
-        self.file_manager.load_files(self.liststore)
+        self.reload_files()
+
+    def on_show_thumbnails_toggled(self, widget):
+        self.show_thumbnails = widget.get_active()
+        self.column_thumbnail.set_visible(self.show_thumbnails)
+        if self.show_thumbnails:
+            self.schedule_thumbnail_update()
+        else:
+            self.thumbnail_cache.retain(set())
+            self.evict_thumbnails(0, -1)
+
+    def on_treeview_scrolled(self, adjustment):
+        if self.show_thumbnails:
+            self.schedule_thumbnail_update()
+
+    def schedule_thumbnail_update(self):
+        # Coalesce bursts of scroll events into a single pass over the visible rows
+        if self.thumbnail_update_source is None:
+            self.thumbnail_update_source = GLib.timeout_add(100, self.update_visible_thumbnails)
+
+    def update_visible_thumbnails(self):
+        self.thumbnail_update_source = None
+        visible_range = self.treeview.get_visible_range()
+        if not self.show_thumbnails or not visible_range:
+            return False
+        start, end = visible_range[0].get_indices()[0], visible_range[1].get_indices()[0]
+        visible_paths = set()
+        for index in range(start, end + 1):
+            row = self.liststore[index]
+            # The Filename cell is editable, the file list holds the path on disk
+            file_path = self.file_manager.file_list[index]
+            visible_paths.add(file_path)
+            if self.thumbnail_cache.is_skipped(file_path):
+                continue
+            if row[6] is None:
+                row_reference = Gtk.TreeRowReference.new(self.liststore, row.path)
+                self.thumbnail_cache.request(file_path, row_reference, self.on_thumbnail_ready)
+            elif index in self.thumbnail_rows:
+                self.thumbnail_rows.move_to_end(index)
+        self.thumbnail_cache.retain(visible_paths)
+
+        # Keep decoded thumbnails for one page above and below the view, the
+        # disk cache makes reloading the rest cheap
+        margin = end - start + 1
+        self.evict_thumbnails(start - margin, end + margin)
+        return False
+
+    def evict_thumbnails(self, keep_start, keep_end):
+        limit = max(self.THUMBNAIL_ROW_LIMIT, keep_end - keep_start + 1)
+        for index, row_reference in list(self.thumbnail_rows.items()):
+            if keep_start <= index <= keep_end and len(self.thumbnail_rows) <= limit:
+                continue
+            del self.thumbnail_rows[index]
+            if row_reference.valid():  # Row may have been removed by a reload
+                self.liststore[row_reference.get_path()][6] = None
+
+    def on_thumbnail_ready(self, row_reference, pixbuf):
+        if row_reference.valid():  # Row may have been removed by a reload
+            path = row_reference.get_path()
+            self.liststore[path][6] = pixbuf
+            index = path.get_indices()[0]
+            self.thumbnail_rows[index] = row_reference
+            self.thumbnail_rows.move_to_end(index)
+
+    def on_destroy(self, widget):
+        self.thumbnail_cache.shutdown()
 
     def on_filter_by_type_clicked(self, widget):
         dialog = Gtk.Dialog(title="Filter by Type", parent=self, modal=True)
@@ -462,7 +778,7 @@ class Renamr(Gtk.Window):
         if response == Gtk.ResponseType.OK:
             file_type = entry.get_text().upper()
             self.file_manager.set_file_type_filter(file_type)
-            self.file_manager.load_files(self.liststore)
+            self.reload_files()
         dialog.destroy()
 
     def on_preview_clicked(self, widget):
@@ -518,7 +834,7 @@ class Renamr(Gtk.Window):
                     logging.info(f"Renamed {original_path} to {new_path}")
 
         logging.info("Renaming completed")
-        self.file_manager.load_files(self.liststore)  # Refresh the folder
+        self.reload_files()  # Refresh the folder
 
     def recognize_date(self, text, date_format):
         date_patterns = [
@@ -537,51 +853,121 @@ class Renamr(Gtk.Window):
                     continue
         return text
 
+    def setup_clipboard_targets(self):
+        selection = Gdk.SELECTION_CLIPBOARD
+        Gtk.selection_add_target(self, selection, Gdk.Atom.intern(FileClipboard.URI_LIST_TARGET, False),
+                                 FileClipboard.TARGET_URI_LIST)
+        Gtk.selection_add_target(self, selection, Gdk.Atom.intern(FileClipboard.GNOME_COPIED_FILES_TARGET, False),
+                                 FileClipboard.TARGET_GNOME_COPIED_FILES)
+        Gtk.selection_add_text_targets(self, selection, FileClipboard.TARGET_TEXT)
+        self.connect("selection-get", self.on_selection_get)
+        self.connect("selection-clear-event", self.on_selection_clear)
+
+    def set_clipboard(self, operation, files):
+        changed_files = self.clipboard.set(operation, files)
+        Gtk.selection_owner_set(self, Gdk.SELECTION_CLIPBOARD, Gdk.CURRENT_TIME)
+        self.update_cut_file_visuals(changed_files)
+
+    def on_selection_get(self, widget, selection_data, info, time):
+        # Clipboard contents are only serialized when another application asks for them
+        if not self.clipboard.files:
+            return
+        if info == FileClipboard.TARGET_URI_LIST:
+            selection_data.set_uris(self.clipboard.get_uris())
+        elif info == FileClipboard.TARGET_GNOME_COPIED_FILES:
+            selection_data.set(selection_data.get_target(), 8, self.clipboard.get_gnome_copied_files())
+        else:
+            selection_data.set_text("\n".join(sorted(self.clipboard.files)), -1)
+
+    def on_selection_clear(self, widget, event):
+        # Another application took over the clipboard
+        if event.selection == Gdk.SELECTION_CLIPBOARD:
+            self.update_cut_file_visuals(self.clipboard.clear())
+        return False
+
     def on_copy_clicked(self, widget):
-        self.copied_files = self.get_selected_files()
-        self.cut_files = []  # Clear cut files
-        clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
-        clipboard.set_text("\n".join(self.copied_files), -1)
-        logging.info(f"Copied files: {self.copied_files}")
+        files = self.get_selected_files()
+        self.set_clipboard("copy", files)
+        logging.info(f"Copied {len(files)} files")
 
     def on_cut_clicked(self, widget):
-        self.cut_files = self.get_selected_files()
-        self.copied_files = []  # Clear copied files
-        clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
-        clipboard.set_text("\n".join(self.cut_files), -1)
-        logging.info(f"Cut files: {self.cut_files}")
-        self.update_cut_file_visuals()
+        files = self.get_selected_files()
+        self.set_clipboard("cut", files)
+        logging.info(f"Cut {len(files)} files")
 
-    def update_cut_file_visuals(self):
-        for row in self.liststore:
-            if os.path.join(self.file_manager.folder_path, row[2]) in self.cut_files:
-                row[5] = Gdk.RGBA(0.5, 0.5, 0.5, 0.5)  # Darker color for cut files
-            else:
-                row[5] = Gdk.RGBA(1, 1, 1, 1)  # Normal color for other files
+    def reload_files(self):
+        self.file_manager.load_files(self.liststore)
+        # The cleared rows invalidated every thumbnail row reference
+        self.thumbnail_rows.clear()
+        self.thumbnail_cache.revalidate()
+        if self.show_thumbnails:
+            self.schedule_thumbnail_update()
+        # Reloaded rows start unstyled, restore the cut state the clipboard still holds
+        if self.clipboard.operation == "cut":
+            self.update_cut_file_visuals(self.clipboard.files)
+
+    def update_cut_file_visuals(self, changed_files):
+        cut_color = Gdk.RGBA(0.5, 0.5, 0.5, 0.5)  # Darker color for cut files
+        normal_color = Gdk.RGBA()  # Same default as freshly loaded rows
+        for file_path in changed_files:
+            index = self.file_manager.file_index.get(file_path)
+            if index is not None:
+                self.liststore[index][5] = cut_color if self.clipboard.is_cut(file_path) else normal_color
 
     def on_paste_clicked(self, widget):
+        if self.clipboard.files:
+            # We still own the clipboard, use the paths we hold instead of round-tripping text
+            self.paste_files(self.clipboard.operation, self.clipboard.files)
+            return
         clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
-        clipboard.request_text(self.on_paste_clipboard_received)
-
-    def on_paste_clipboard_received(self, clipboard, text):
-        if text:
-            paths = text.split("\n")
-            for file_path in paths:
-                if os.path.exists(file_path):
-                    if self.cut_files:
-                        new_path = os.path.join(self.file_manager.folder_path, os.path.basename(file_path))
-                        shutil.move(file_path, new_path)
-                        self.undo_stack.append(('move', file_path, new_path))  # Record move operation
-                        logging.info(f"Moved {file_path} to {self.file_manager.folder_path}")
-                    else:
-                        new_path = os.path.join(self.file_manager.folder_path, os.path.basename(file_path))
-                        shutil.copy(file_path, new_path)
-                        self.undo_stack.append(('copy', file_path, new_path))  # Record copy operation
-                        logging.info(f"Pasted {file_path} to {self.file_manager.folder_path}")
-            self.cut_files = []  # Clear cut files after moving
-            self.file_manager.load_files(self.liststore)
+        clipboard.request_contents(Gdk.Atom.intern(FileClipboard.GNOME_COPIED_FILES_TARGET, False),
+                                   self.on_paste_clipboard_received)
+
+    def on_paste_clipboard_received(self, clipboard, selection_data):
+        operation, paths = None, []
+        if selection_data.get_length() > 0:
+            operation, paths = FileClipboard.parse_gnome_copied_files(selection_data.get_data())
+        if paths:
+            self.paste_files(operation, paths)
         else:
+            clipboard.request_uris(self.on_paste_uris_received)
+
+    def on_paste_uris_received(self, clipboard, uris):
+        paths = FileClipboard.paths_from_uris(uris or [])
+        if paths:
+            self.paste_files("copy", paths)
+        else:
+            # Plain newline-separated paths, e.g. from a terminal or an older Renamr
+            clipboard.request_text(self.on_paste_text_received)
+
+    def on_paste_text_received(self, clipboard, text):
+        # Only absolute paths that exist, so prose or relative names never reach shutil
+        paths = [line for line in (text or "").splitlines() if os.path.isabs(line) and os.path.exists(line)]
+        self.paste_files("copy", paths)
+
+    def paste_files(self, operation, paths):
+        pasted = 0
+        for file_path in paths:
+            new_path = os.path.join(self.file_manager.folder_path, os.path.basename(file_path))
+            try:
+                if operation == "cut":
+                    shutil.move(file_path, new_path)
+                    self.undo_stack.append(('move', file_path, new_path))  # Record move operation
+                    logging.info(f"Moved {file_path} to {self.file_manager.folder_path}")
+                else:
+                    shutil.copy(file_path, new_path)
+                    self.undo_stack.append(('copy', file_path, new_path))  # Record copy operation
+                    logging.info(f"Pasted {file_path} to {self.file_manager.folder_path}")
+                pasted += 1
+            except OSError as e:  # Also covers shutil.Error and shutil.SameFileError
+                logging.warning(f"Could not paste {file_path}: {e}")
+        if operation == "cut":
+            self.clipboard.clear()  # Cut files can only be pasted once
+        self.reload_files()
+        if not paths:
             Notify.Notification.new("Paste Error", "No valid file path in clipboard", None).show()
+        elif not pasted:
+            Notify.Notification.new("Paste Error", "None of the files in the clipboard could be pasted", None).show()
 
     def on_delete_clicked(self, widget):
         for row in self.liststore:
@@ -590,7 +976,7 @@ class Renamr(Gtk.Window):
                 send2trash(file_path)  # Move the file to trash using send2trash
                 self.undo_stack.append(('delete', file_path, None))  # Record delete operation
                 logging.info(f"Moved to trash: {file_path}")
-        self.file_manager.load_files(self.liststore)
+        self.reload_files()
 
     def on_select_clicked(self, widget):
         self.select_files()
@@ -624,7 +1010,7 @@ class Renamr(Gtk.Window):
                 # Restoring deleted files from trash is not straightforward and might not be cross-platform compatible
                 logging.warning(f"Undo delete not supported: {src}")
 
-            self.file_manager.load_files(self.liststore)
+            self.reload_files()
 
     def on_save_config_clicked(self, widget):
         config = {
@@ -680,7 +1066,8 @@ class Renamr(Gtk.Window):
     def get_selected_files(self):
         selection = self.treeview.get_selection()
         model, paths = selection.get_selected_rows()
-        return [os.path.join(self.file_manager.folder_path, model[path][2]) for path in paths]
+        # The Filename cell is editable, the file list holds the path on disk
+        return [self.file_manager.file_list[path.get_indices()[0]] for path in paths]
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Renamr")